@@ -47,6 +47,13 @@ def init_db():
         if "email_to" not in existing_columns:
             cur.execute("ALTER TABLE report_schedules ADD COLUMN email_to TEXT")
 
+        # 4️⃣ Partial index for load_schedules(), which only reads enabled rows
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_schedules_enabled
+        ON report_schedules(enabled)
+        WHERE enabled = 1
+        """)
+
         conn.commit()
 
 def insert_test_schedule(schedule_id):
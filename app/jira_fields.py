@@ -0,0 +1,81 @@
+"""
+Per-issue row building for the JIRA reports.
+
+Pure Python on purpose (no pandas/requests), so the hot per-issue loop can
+be imported and profiled on its own, and runs unchanged under PyPy.
+"""
+from datetime import date
+
+
+def _pick(item):
+    # Same result as item.get("displayName") or item.get("name") or
+    # item.get("value"); membership tests and subscripts skip the
+    # method calls, which is most of the cost on the common shapes
+    if "displayName" in item:
+        value = item["displayName"]
+        if value:
+            return value
+    if "name" in item:
+        value = item["name"]
+        if value:
+            return value
+    return item.get("value")
+
+
+def get_value(field):
+    if field is None:
+        return None
+    if isinstance(field, dict):
+        return _pick(field)
+    if isinstance(field, list):
+        # exact class check is cheaper than isinstance for plain JSON dicts;
+        # join() copies any iterable into a list first, so build it directly
+        return ", ".join([value for item in field if item.__class__ is dict if (value := _pick(item))])
+    return field
+
+
+def normalize_date_only(date_str):
+    if not date_str:
+        return None
+    try:
+        return date.fromisoformat(date_str).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+# ==========================
+# ROW BUILDING
+# ==========================
+# System fields JIRA always returns (possibly null) when requested; these
+# are subscripted, everything else (customfields, optional fields) uses .get
+REQUIRED_FIELDS = {"summary", "issuetype", "status", "created", "updated"}
+
+# Source for each kind's value expression, filled in with the JIRA field key.
+# "raw" numbers are written as JIRA sends them: whole seconds print as "18",
+# where the old single-DataFrame export printed "18.0" whenever the column
+# also had empty cells (pandas widened it to float64)
+KIND_TEMPLATES = {
+    "key": 'issue["key"]',
+    "project": 'f[{field!r}]["key"] if f.get({field!r}) else None',
+    "value": "get_value({get})",
+    "raw": "{get}",
+    "datetime": "{get}",
+    "date": "normalize_date_only({get})",
+    "hours": "{get}"
+}
+
+
+def compile_row_builder(field_specs):
+    """
+    Generates build_row(f, issue) from field_specs with every field access
+    inlined, so building a row is one tuple display per issue instead of a
+    call per column. Values come out in field_specs order.
+    """
+    lines = ["def build_row(f, issue):", "    return ("]
+    for _, field, kind in field_specs:
+        get = f"f[{field!r}]" if field in REQUIRED_FIELDS else f"f.get({field!r})"
+        lines.append(f"        {KIND_TEMPLATES[kind].format(field=field, get=get)},")
+    lines.append("    )")
+
+    namespace = {"get_value": get_value, "normalize_date_only": normalize_date_only}
+    exec("\n".join(lines), namespace)
+    return namespace["build_row"]
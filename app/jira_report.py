@@ -0,0 +1,655 @@
+import requests
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain, islice
+from zoneinfo import ZoneInfo
+from app.jira_fields import compile_row_builder
+import argparse
+import csv
+import gzip
+import json
+import os
+import traceback
+import signal
+import sys
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback when the orjson wheel is unavailable
+    orjson = None
+
+
+def json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def json_dumps(obj):
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
+
+
+# ==========================
+# REPORT DEFINITION
+# ==========================
+@dataclass
+class ReportConfig:
+    """
+    Everything that differs between two JIRA search reports.
+
+    jql_filter    -> JQL conditions ahead of the created-date range
+    fields        -> JIRA fields requested from /search
+    field_specs   -> (column, JIRA field, kind) in CSV output order
+    auth          -> "basic" (JIRA_URL/JIRA_USERNAME/JIRA_PASSWORD)
+                     or "jsm_pat" (JSM_URL/JSM_PAT bearer token)
+    """
+    description: str
+    jql_filter: str
+    fields: list
+    field_specs: list
+    page_size: int = 500
+    timeout: float = None
+    auth: str = "basic"
+
+
+PROGRESS_INTERVAL = 1.0  # seconds between "running" progress writes
+FETCH_WORKERS = 8
+
+# 429 handling: concurrency is halved on every throttled response and
+# grows back by one after THROTTLE_GROW_AFTER successful pages
+THROTTLE_RETRIES = 6
+THROTTLE_BACKOFF = 1.0     # seconds, doubled per attempt without Retry-After
+THROTTLE_MAX_DELAY = 60.0
+THROTTLE_GROW_AFTER = 50
+
+IST = ZoneInfo("Asia/Kolkata")
+
+# ==========================
+# ARGUMENTS FROM BACKEND
+# ==========================
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def parse_args(description, argv=None):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--start-date", required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end-date", help="YYYY-MM-DD")
+    parser.add_argument("--output", required=True, help="Output file (.csv, .csv.gz, .feather or .parquet)")
+    parser.add_argument("--job-id", required=True)
+    parser.add_argument("--statuses", help="Comma-separated list of Jira statuses", default="")
+    parser.add_argument("--till-now", action="store_true", help="If set, end date is current time")
+    parser.add_argument("--page-size", type=positive_int, help="maxResults per search page (default: the report's page size)")
+
+    args = parser.parse_args(argv)
+
+    if not args.till_now and not args.end_date:
+        raise ValueError("End date is required unless till-now is set")
+
+    return args
+
+
+def bearer_auth(token):
+    def apply(request):
+        request.headers["Authorization"] = f"Bearer {token}"
+        return request
+    return apply
+
+
+def get_connection(auth):
+    """Returns (base URL, requests auth) for the report's JIRA instance."""
+    if auth == "jsm_pat":
+        jsm_url = os.getenv("JSM_URL")
+        pat_token = os.getenv("JSM_PAT")
+
+        if not jsm_url:
+            raise RuntimeError("JSM_URL environment variable not set")
+        if not pat_token:
+            raise RuntimeError("JSM_PAT environment variable not set")
+
+        return jsm_url, bearer_auth(pat_token)
+
+    jira_url = os.getenv("JIRA_URL")
+    username = os.getenv("JIRA_USERNAME")
+    password = os.getenv("JIRA_PASSWORD")
+
+    if not jira_url:
+        raise RuntimeError("JIRA_URL environment variable not set")
+    if not username:
+        raise RuntimeError("JIRA_USERNAME environment variable not set")
+    if not password:
+        raise RuntimeError("JIRA_PASSWORD environment variable not set")
+
+    return jira_url, HTTPBasicAuth(username, password)
+
+# ==========================
+# DYNAMIC JQL (FROM UI)
+# ==========================
+def build_ist_range(start_date_str, end_date_str, till_now):
+    """
+    start_date_str, end_date_str -> 'YYYY-MM-DD'
+    Returns IST datetime strings usable directly in JQL
+    """
+
+    # Start date always begins at 00:00
+    start_dt = f"{start_date_str} 00:00"
+
+    if till_now:
+        # Explicit user intent: till now
+        end_dt = datetime.now(IST).strftime("%Y-%m-%d %H:%M")
+    else:
+        # Explicit end date always means full day
+        end_dt = f"{end_date_str} 23:59"
+
+    return start_dt, end_dt
+
+
+def build_status_clause(statuses_arg):
+    """--statuses "Open, Closed" -> 'AND status IN ("Open","Closed")'"""
+    statuses = [s.strip() for s in statuses_arg.split(",") if s.strip()]
+    if not statuses:
+        return ""
+
+    quoted_statuses = ",".join(f'"{s}"' for s in statuses)
+    return f"AND status IN ({quoted_statuses})"
+
+
+def build_jql(jql_filter, start_str, end_str, status_clause):
+    # Sorting on the unique issue key is the cheapest order that still keeps
+    # offset pages stable while they are fetched in parallel. Ascending, so
+    # issues created during a --till-now export land after the last page
+    # instead of shifting every startAt window and duplicating rows.
+    # Output order: keys are allocated in creation order within a project,
+    # so single-project reports list the oldest issues first; a filter
+    # spanning projects (JSM Incident) is grouped by project key, not by
+    # creation time. Sort on the Created column downstream if needed.
+    return f'''
+{jql_filter}
+AND created >= "{start_str}"
+AND created <= "{end_str}"
+{status_clause}
+ORDER BY key ASC
+'''
+
+# ==========================
+# PROGRESS
+# ==========================
+def make_progress_writer(progress_file):
+    last_write = 0.0
+
+    def update_progress(completed, total, status="running", error=None):
+        nonlocal last_write
+
+        # Throttle intermediate updates; state changes are always written
+        if status == "running":
+            now = time.monotonic()
+            if now - last_write < PROGRESS_INTERVAL:
+                return
+            last_write = now
+
+        payload = {
+            "completed": completed,
+            "total": total,
+            "status": status
+        }
+        if error:
+            payload["error"] = error
+
+        # Write-then-rename so /job-status never reads a half-written file
+        tmp_file = f"{progress_file}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(json_dumps(payload))
+        os.replace(tmp_file, progress_file)
+
+    return update_progress
+
+# ==========================
+# COLUMN CONVERSION
+# ==========================
+def to_ist_datetimes(values):
+    """
+    Vectorised IST conversion for one column of raw JIRA timestamps.
+    Empty or unparseable values come back as None.
+    """
+    parsed = pd.to_datetime(
+        pd.Series(values, dtype="object"),
+        utc=True,
+        errors="coerce",
+        format="ISO8601"
+    )
+    formatted = parsed.dt.tz_convert(IST).dt.strftime("%Y-%m-%d %H:%M:%S")
+    return formatted.astype(object).where(parsed.notna(), None).tolist()
+
+
+def to_hours(values):
+    """
+    Vectorised seconds -> hours for one column, same values as
+    round((seconds or 0) / 3600, 2).
+    """
+    seconds = pd.Series(values, dtype="float64").fillna(0)
+    hours = (seconds / 3600).round(2)
+    # NumPy rounds exact halves to even while round() works on the float
+    # quotient, so the half-way cases (seconds % 36 == 18) go through round()
+    ties = seconds % 36 == 18
+    hours[ties] = [round(value / 3600, 2) for value in seconds[ties]]
+    return hours.tolist()
+
+# ==========================
+# PAGE BUILDING
+# ==========================
+# Kinds converted column-wise a page at a time, after build_row
+COLUMN_CONVERTERS = {
+    "datetime": to_ist_datetimes,
+    "hours": to_hours
+}
+
+
+def make_page_builder(field_specs):
+    """
+    Returns page_rows(data) -> output rows for one search page.
+
+    It runs in the fetch workers, so parsing and row building for one page
+    overlap the network wait of the others.
+    """
+    build_row = compile_row_builder(field_specs)
+    converters = [
+        (i, COLUMN_CONVERTERS[kind])
+        for i, (_, _, kind) in enumerate(field_specs)
+        if kind in COLUMN_CONVERTERS
+    ]
+
+    def page_rows(data):
+        issues = data.get("issues", [])
+        if not issues:
+            return []
+
+        # Transpose the page so converted columns take one call each
+        columns = list(zip(*[build_row(issue["fields"], issue) for issue in issues]))
+        for i, convert in converters:
+            columns[i] = convert(columns[i])
+
+        return list(zip(*columns))
+
+    return page_rows
+
+# ==========================
+# JIRA SEARCH
+# ==========================
+class AdaptiveLimiter:
+    """
+    AIMD limit on in-flight search requests, shared by the fetch workers.
+
+    slot() yields the limit generation the request was sent under, so a
+    burst of 429s from requests already in flight only halves the limit once.
+    """
+
+    def __init__(self, limit):
+        self.max_limit = limit
+        self.limit = limit
+        self.in_flight = 0
+        self.successes = 0
+        self.generation = 0
+        self.cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        with self.cond:
+            while self.in_flight >= self.limit:
+                self.cond.wait()
+            self.in_flight += 1
+            generation = self.generation
+        try:
+            yield generation
+        finally:
+            with self.cond:
+                self.in_flight -= 1
+                self.cond.notify()
+
+    def throttled(self, generation):
+        with self.cond:
+            if generation == self.generation:
+                self.limit = max(1, self.limit // 2)
+                self.generation += 1
+                self.successes = 0
+            return self.limit
+
+    def succeeded(self):
+        with self.cond:
+            self.successes += 1
+            if self.successes >= THROTTLE_GROW_AFTER and self.limit < self.max_limit:
+                self.limit += 1
+                self.successes = 0
+                self.cond.notify()
+
+
+def retry_after_seconds(response, attempt):
+    """Delay requested by a 429; exponential backoff if it sends none (or an HTTP date)."""
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        delay = THROTTLE_BACKOFF * 2 ** attempt
+    return min(max(delay, 0.0), THROTTLE_MAX_DELAY)
+
+
+def make_session(jira_url, auth):
+    session = requests.Session()
+    session.auth = auth
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    })
+    session.mount(jira_url, HTTPAdapter(
+        pool_connections=FETCH_WORKERS,
+        pool_maxsize=FETCH_WORKERS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            # 429 is left to post_search so the limiter sees the throttling;
+            # urllib3 would otherwise retry it on Retry-After by itself
+            status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=False,
+            allowed_methods=["POST"],  # search is read-only, safe to retry
+            raise_on_status=False
+        )
+    ))
+    return session
+
+# Sessions outlive a single report: the scheduler runs reports in-process,
+# so later runs against the same JIRA reuse the pooled (already
+# TLS-handshaken) connections. Keyed by (auth kind, base URL).
+SESSIONS = {}
+
+
+def get_session(auth_kind, jira_url, auth):
+    key = (auth_kind, jira_url)
+    session = SESSIONS.get(key)
+    if session is None:
+        session = SESSIONS[key] = make_session(jira_url, auth)
+    return session
+
+# ==========================
+# OUTPUT
+# ==========================
+@contextmanager
+def open_output(output_file, column_names):
+    """
+    Yields a callable that writes one page of rows to output_file.
+    CSV is streamed page by page (gzipped for .csv.gz); .feather/.parquet (pyarrow required)
+    are columnar, so each page is packed into an Arrow table as it arrives
+    and the tables are written once at the end.
+    """
+    ext = os.path.splitext(output_file)[1].lower()
+
+    if ext in (".feather", ".parquet"):
+        import pyarrow as pa
+
+        names = list(column_names)
+        tables = []
+
+        def write_rows(rows):
+            if rows:
+                tables.append(pa.Table.from_arrays([pa.array(c) for c in zip(*rows)], names=names))
+
+        yield write_rows
+
+        if tables:
+            # A column that is empty on one page comes back as null type
+            # there, and one holding only whole numbers as int64 where
+            # another page has doubles; permissive widens both
+            table = pa.concat_tables(tables, promote_options="permissive")
+        else:
+            table = pa.table({name: pa.array([]) for name in names})
+
+        if ext == ".feather":
+            import pyarrow.feather as feather
+            feather.write_feather(table, output_file)
+        else:
+            import pyarrow.parquet as pq
+            pq.write_table(table, output_file, compression="zstd", compression_level=1)
+        return
+
+    if ext == ".gz":
+        # Report CSVs compress well; level 1 keeps the CPU cost small
+        fh = gzip.open(output_file, "wt", newline="", encoding="utf-8-sig", compresslevel=1)
+    else:
+        fh = open(output_file, "w", newline="", encoding="utf-8-sig", buffering=1 << 20)
+
+    with fh:
+        writer = csv.writer(fh, lineterminator="\n")
+        writer.writerow(column_names)
+        yield writer.writerows
+
+# ==========================
+# RUN REPORT
+# ==========================
+def run_report(config, argv=None):
+    """
+    Runs one report export. argv defaults to the command line; the
+    scheduler passes its own to run reports in-process.
+    """
+    args = parse_args(config.description, argv)
+    status_clause = build_status_clause(args.statuses)
+
+    jira_url, auth = get_connection(config.auth)
+
+    start_str, end_str = build_ist_range(
+        args.start_date,
+        args.end_date,
+        args.till_now
+    )
+
+    print(f"[INFO] Effective report range IST: {start_str} → {end_str}")
+
+    jql = build_jql(config.jql_filter, start_str, end_str, status_clause)
+
+    print("Executing JQL:")
+    print(jql)
+
+    update_progress = make_progress_writer(f"/tmp/{args.job_id}.json")
+    state = {"completed": 0, "total": 0}
+
+    # Also seen by the fetch workers, so in-flight pages stop retrying
+    # and nothing new is sent once the job is cancelled
+    cancelled = threading.Event()
+
+    def handle_sigterm(signum, frame):
+        cancelled.set()
+
+        update_progress(
+            completed=state["completed"],
+            total=state["total"],
+            status="cancelled"
+        )
+
+        print("⚠️ Job cancelled (SIGTERM received)")
+        sys.exit(0)
+
+    column_names = tuple(name for name, _, _ in config.field_specs)
+    page_rows = make_page_builder(config.field_specs)
+    session = get_session(config.auth, jira_url, auth)
+    limiter = AdaptiveLimiter(FETCH_WORKERS)
+
+    # Identical in every search request; only the paging keys change
+    search_body = {"jql": jql, "fields": config.fields}
+
+    def post_search(path, payload):
+        body = json_dumps(payload)
+        for attempt in range(THROTTLE_RETRIES):
+            if cancelled.is_set():
+                raise KeyboardInterrupt
+
+            with limiter.slot() as generation:
+                response = session.post(
+                    f"{jira_url}{path}",
+                    data=body,
+                    timeout=config.timeout
+                )
+
+            if response.status_code != 429 or attempt == THROTTLE_RETRIES - 1:
+                break
+
+            limit = limiter.throttled(generation)
+            delay = retry_after_seconds(response, attempt)
+            print(
+                f"[WARN] JIRA throttled the search (429), retrying in {delay:.1f}s "
+                f"with {limit} concurrent request(s)"
+            )
+            cancelled.wait(delay)
+
+        response.raise_for_status()
+        limiter.succeeded()
+        return json_loads(response.content)
+
+    def fetch_page(start_at, page_size):
+        return post_search("/rest/api/2/search", {
+            **search_body,
+            "startAt": start_at,
+            "maxResults": page_size
+        })
+
+    def fetch_token_pages(executor, page_size):
+        # Cursor pagination through /search/jql for sites where the offset
+        # /search endpoint has been retired (JIRA Cloud). Requests are
+        # strictly sequential since each token comes from the page before,
+        # so rows for page N are built on the executor while N+1 is fetched
+        token = None
+        building = None
+        while True:
+            payload = {**search_body, "maxResults": page_size}
+            if token:
+                payload["nextPageToken"] = token
+
+            data = post_search("/rest/api/2/search/jql", payload)
+            if building:
+                yield building.result()
+            building = executor.submit(page_rows, data)
+
+            token = data.get("nextPageToken")
+            if data.get("isLast") or not token:
+                break
+
+        yield building.result()
+
+    def fetch_offset_pages(executor, offsets, page_size):
+        # Only a bounded window of pages is submitted ahead of the writer:
+        # if one page stalls on a 429 backoff or 5xx retries, the finished
+        # pages behind it wait in memory, so the window caps how many
+        def fetch_rows(offset):
+            return page_rows(fetch_page(offset, page_size))
+
+        offsets = iter(offsets)
+        window = deque(
+            executor.submit(fetch_rows, offset)
+            for offset in islice(offsets, FETCH_WORKERS * 2)
+        )
+        while window:
+            rows = window.popleft().result()
+            offset = next(offsets, None)
+            if offset is not None:
+                window.append(executor.submit(fetch_rows, offset))
+            yield rows
+
+    def search_pages(executor):
+        """
+        Returns (total, pages of output rows). With offset /search the first
+        page gives the total and the rest are fetched concurrently;
+        /search/jql does not report a total, so it comes back as 0.
+        """
+        page_size = args.page_size or config.page_size
+
+        try:
+            first_page = fetch_page(0, page_size)
+        except requests.HTTPError as e:
+            if e.response.status_code not in (404, 410):
+                raise
+            print("[INFO] /search is not available, paging with nextPageToken")
+            return 0, fetch_token_pages(executor, page_size)
+
+        # Recorded before any rows are built, so a failure on the first
+        # page still reports the total in the progress file
+        total = state["total"] = first_page.get("total", 0)
+        print(f"[INFO] JQL returned {total} issues")
+
+        # JIRA silently caps maxResults; follow the server's page size
+        returned = len(first_page.get("issues", []))
+        if 0 < returned < min(page_size, total):
+            print(
+                f"[WARN] JIRA returned {returned} issues for maxResults={page_size}, "
+                f"using {returned} as page size"
+            )
+            page_size = returned
+
+        pages = chain(
+            [page_rows(first_page)],
+            fetch_offset_pages(executor, range(page_size, total, page_size), page_size)
+        )
+        return total, pages
+
+    # ==========================
+    # FETCH DATA (PAGINATION)
+    # ==========================
+    update_progress(0, 0, status="starting")
+
+    executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+
+    # Scheduled runs execute in the main thread of a long-lived processpool
+    # worker, so the previous handler is put back once this run is over;
+    # otherwise a later SIGTERM would hit this run's stale closure
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    if in_main_thread:
+        previous_sigterm = signal.signal(signal.SIGTERM, handle_sigterm)
+
+    try:
+        with open_output(args.output, column_names) as write_rows:
+
+            total_issues, pages = search_pages(executor)
+            update_progress(0, total_issues)
+
+            for rows in pages:
+
+                if cancelled.is_set():
+                    raise KeyboardInterrupt
+
+                write_rows(rows)
+
+                state["completed"] += len(rows)
+                update_progress(state["completed"], total_issues)
+
+        update_progress(state["completed"], state["completed"], status="completed")
+        print(f"✅ {config.description} exported: {args.output}")
+
+    except KeyboardInterrupt:
+        update_progress(
+            completed=state["completed"],
+            total=state["total"],
+            status="cancelled"
+        )
+        print("⚠️ Job cancelled by user")
+        sys.exit(0)
+
+    except Exception as e:
+        update_progress(
+            completed=state["completed"],
+            total=state["total"],
+            status="failed",
+            error=str(e)
+        )
+
+        print("❌ Job failed")
+        traceback.print_exc()
+        raise
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if in_main_thread:
+            signal.signal(signal.SIGTERM, previous_sigterm)
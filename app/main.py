@@ -5,7 +5,7 @@ from starlette.requests import Request
 from fastapi.staticfiles import StaticFiles
 from datetime import datetime
 from typing import List, Optional
-from app.scheduler import scheduler, load_schedules, start_scheduler
+from app.scheduler import load_schedules, start_scheduler, stop_scheduler
 from uuid import uuid4
 from app.db import insert_schedule, fetch_schedules, toggle_schedule
 import subprocess
@@ -13,10 +13,10 @@ import uuid
 import os
 import json
 import time
-import signal
-import pytz
+import sys
+from zoneinfo import ZoneInfo
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")
 
 app = FastAPI()
 templates = Jinja2Templates(directory="app/templates")
@@ -30,27 +30,27 @@ TMP_RETENTION_SECONDS = 24 * 60 * 60  # 24 hours
 
 REPORT_CONFIG = {
     "jira_infosol": {
-        "script": "app/Infosol.py",
+        "module": "app.reports.infosol",
         "filename": "JIRA-INFOSOL-Report.csv"
     },
     "jira_ops": {
-        "script": "app/OPS-Task-Bug.py",
+        "module": "app.reports.ops_task_bug",
         "filename": "JIRA-OPS-Task-Bug-Report.csv"
     },
     "jira_ops_cr": {
-        "script": "app/OPS-CR.py",
+        "module": "app.reports.ops_cr",
         "filename": "JIRA-OPS-CR-Report.csv"
     },
     "jira_asd_incident": {
-        "script": "app/ASD-Incident.py",
+        "module": "app.reports.asd_incident",
         "filename": "JIRA-ASD-INCIDENT-Report.csv"
     },
     "jira_asd_pm": {
-        "script": "app/ASD-PM.py",
+        "module": "app.reports.asd_pm",
         "filename": "JIRA-ASD-PM-Report.csv"
     },
     "jsm_incident": {
-        "script": "app/JSM-Incident.py",
+        "module": "app.reports.jsm_incident",
         "filename": "JSM-INCIDENT-Report.csv"
     }
 }
@@ -83,6 +83,25 @@ def cleanup_tmp_files():
 def startup_event():
     start_scheduler()
 
+@app.on_event("shutdown")
+def shutdown_event():
+    # Report processes would otherwise outlive the app and keep querying
+    # JIRA with nobody left to serve the result; SIGTERM makes them record
+    # "cancelled" and exit. Scheduled runs in the pool get the same
+    # treatment, all within one deadline
+    running = [p for p in JOB_PROCESSES.values() if p.poll() is None]
+    for process in running:
+        process.terminate()
+
+    deadline = time.monotonic() + 10
+    stop_scheduler(deadline)
+
+    for process in running:
+        try:
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            process.kill()
+
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
@@ -126,8 +145,9 @@ def start_job(
         "filename": config["filename"]
     })
 
+    # Same interpreter (and venv) as the web app, no PATH lookup
     cmd = [
-        "python", config["script"],
+        sys.executable, "-m", config["module"],
         "--start-date", start_date,
         "--output", output_file,
         "--job-id", job_id
@@ -146,7 +166,7 @@ def start_job(
     
     process = subprocess.Popen(cmd)
 
-    JOB_PROCESSES[job_id] = process.pid
+    JOB_PROCESSES[job_id] = process
 
     return {"job_id": job_id}
 
@@ -174,6 +194,12 @@ def job_status(job_id: str):
                 job["end_time"] = now_ist()
                 job["error"] = data.get("error")
 
+    # Reap the finished report process so it doesn't linger as a zombie
+    if data.get("status") in ("completed", "failed", "cancelled"):
+        process = JOB_PROCESSES.pop(job_id, None)
+        if process:
+            process.poll()
+
     return data
 
 @app.get("/download/{job_id}")
@@ -191,24 +217,27 @@ def download(job_id: str):
 
 @app.post("/cancel-job/{job_id}")
 def cancel_job(job_id: str):
-    pid = JOB_PROCESSES.get(job_id)
+    process = JOB_PROCESSES.get(job_id)
 
-    if not pid:
+    if not process:
         raise HTTPException(status_code=404, detail="Job not running")
 
-    try:
-        os.kill(pid, signal.SIGTERM)
-    except ProcessLookupError:
-        pass
+    # Popen checks the child hasn't already been reaped, so a recycled pid
+    # is never signalled
+    process.terminate()
 
     # 🔴 WRITE PROGRESS FILE
+    # Same write-then-rename as the report side, so job_status never
+    # reads a half-written file
     progress_file = f"/tmp/{job_id}.json"
-    with open(progress_file, "w") as f:
+    tmp_file = f"{progress_file}.cancel.tmp"
+    with open(tmp_file, "w") as f:
         json.dump({
             "status": "cancelled",
             "completed": 0,
             "total": 0
         }, f)
+    os.replace(tmp_file, progress_file)
 
     # 🔴 CRITICAL FIX: UPDATE JOB HISTORY IMMEDIATELY
     for job in JOB_HISTORY:
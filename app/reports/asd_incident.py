@@ -0,0 +1,73 @@
+from app.jira_report import ReportConfig, run_report
+
+# ==========================
+# FIELDS (UNCHANGED – 34)
+# ==========================
+FIELDS = [
+    "project","issuekey","summary","issuetype","status","assignee",
+    "reporter","created","updated","resolutiondate","customfield_23866",
+    "customfield_14267","customfield_11266","customfield_15570",
+    "customfield_15262","customfield_13861","customfield_10694",
+    "customfield_15578","customfield_13860","customfield_10371",
+    "customfield_16060","customfield_15961","customfield_27870",
+    "customfield_10041","customfield_23979","customfield_15565",
+    "customfield_22361","customfield_15560","customfield_15960",
+    "customfield_14261","customfield_13061","customfield_15964",
+    "customfield_29964","aggregatetimespent"
+]
+
+# ==========================
+# CSV COLUMNS (OUTPUT ORDER)
+# ==========================
+# (column, JIRA field, kind) - kind picks the extractor used for the value
+FIELD_SPECS = [
+    ("Project", "project", "project"),
+    ("Key", "key", "key"),
+    ("Summary", "summary", "raw"),
+    ("Issue Type", "issuetype", "value"),
+    ("Status", "status", "value"),
+    ("Assignee", "assignee", "value"),
+    ("Reporter", "reporter", "value"),
+
+    ("Created", "created", "datetime"),
+    ("Updated", "updated", "datetime"),
+    ("Resolved", "resolutiondate", "datetime"),
+    ("Target Date-Waiting", "customfield_16060", "datetime"),
+    ("Revised Target Date-Waiting", "customfield_15961", "datetime"),
+
+    ("Brief Description", "customfield_23866", "raw"),
+    ("Incident Source", "customfield_14267", "value"),
+    ("Country", "customfield_11266", "value"),
+    ("Unit", "customfield_15570", "value"),
+    ("Affected_CI", "customfield_15262", "raw"),
+    ("Infra_App", "customfield_13861", "value"),
+    ("Category", "customfield_10694", "value"),
+    ("Owner_Name", "customfield_15578", "raw"),
+    ("Waiting Type", "customfield_13860", "value"),
+    ("Reason for Waiting", "customfield_10371", "value"),
+    ("Security Incident", "customfield_27870", "value"),
+    ("Comments", "customfield_10041", "raw"),
+    ("Fault Attribution", "customfield_23979", "value"),
+    ("Closure Code", "customfield_15565", "value"),
+    ("Resolved By", "customfield_22361", "value"),
+    ("Incident Geography", "customfield_15560", "value"),
+    ("Application Name", "customfield_15960", "value"),
+    ("Incident Priority", "customfield_14261", "value"),
+    ("Incident Assigned To", "customfield_13061", "value"),
+    ("Site_Location", "customfield_15964", "raw"),
+    ("Service Impact", "customfield_29964", "value"),
+
+    ("Σ Time Spent (Seconds)", "aggregatetimespent", "raw")
+]
+
+CONFIG = ReportConfig(
+    description="JIRA ASD Incident Report",
+    jql_filter="project = asd AND issuetype = Incident",
+    fields=FIELDS,
+    field_specs=FIELD_SPECS,
+    page_size=500,
+    timeout=60
+)
+
+if __name__ == "__main__":
+    run_report(CONFIG)
@@ -0,0 +1,62 @@
+from app.jira_report import ReportConfig, run_report
+
+# ==========================
+# FIELDS (UNCHANGED – 26)
+# ==========================
+FIELDS = [
+    "project","issuekey","summary","issuetype","status","assignee",
+    "reporter","created","updated","customfield_15960","customfield_15570",
+    "customfield_14267","customfield_13862","customfield_10850",
+    "customfield_10851","customfield_29660","customfield_15565",
+    "customfield_13861","customfield_15560","customfield_15162",
+    "customfield_29662","customfield_11266","customfield_13061",
+    "customfield_10694","customfield_15262","aggregatetimespent"
+]
+
+# ==========================
+# CSV COLUMNS (OUTPUT ORDER)
+# ==========================
+# (column, JIRA field, kind) - kind picks the extractor used for the value
+FIELD_SPECS = [
+    ("Project", "project", "project"),
+    ("Key", "key", "key"),
+    ("Summary", "summary", "raw"),
+    ("Issue Type", "issuetype", "value"),
+    ("Status", "status", "value"),
+    ("Assignee", "assignee", "value"),
+    ("Reporter", "reporter", "value"),
+
+    ("Created", "created", "datetime"),
+    ("Updated", "updated", "datetime"),
+
+    ("Application Name", "customfield_15960", "value"),
+    ("Unit", "customfield_15570", "value"),
+    ("Incident Source", "customfield_14267", "value"),
+    ("Investigation Reason", "customfield_13862", "value"),
+    ("Root Cause Analysis (RCA)", "customfield_10850", "raw"),
+    ("Corrective & Preventive Action (CAPA)", "customfield_10851", "raw"),
+    ("Known Issue", "customfield_29660", "value"),
+    ("Closure Code", "customfield_15565", "value"),
+    ("Infra_App", "customfield_13861", "value"),
+    ("Incident Geography", "customfield_15560", "value"),
+    ("5 Why Analysis", "customfield_15162", "raw"),
+    ("Validator Approved", "customfield_29662", "value"),
+    ("Country", "customfield_11266", "value"),
+    ("Incident Assigned To", "customfield_13061", "value"),
+    ("Category", "customfield_10694", "value"),
+    ("Affected_CI", "customfield_15262", "raw"),
+
+    ("Σ Time Spent (Seconds)", "aggregatetimespent", "raw")
+]
+
+CONFIG = ReportConfig(
+    description="JIRA ASD PM (Problem) Report",
+    jql_filter="project = asd AND issuetype = Problem",
+    fields=FIELDS,
+    field_specs=FIELD_SPECS,
+    page_size=1000,
+    timeout=60
+)
+
+if __name__ == "__main__":
+    run_report(CONFIG)
@@ -0,0 +1,115 @@
+from app.jira_report import ReportConfig, run_report
+
+# ==========================
+# FIELDS TO FETCH (UNCHANGED)
+# ==========================
+FIELDS = [
+    "project","issuekey","summary","issuetype","priority",
+    "customfield_10190","customfield_23875","status","assignee",
+    "reporter","customfield_10748","created","updated",
+    "resolutiondate","customfield_10072","customfield_10076",
+    "customfield_28467","customfield_10007","customfield_14960",
+    "customfield_10078","customfield_10001","customfield_10120",
+    "customfield_11342","customfield_11563","customfield_26667",
+    "customfield_18161","customfield_18172","customfield_11332",
+    "customfield_25561","customfield_18460","customfield_18461",
+    "customfield_18162","customfield_22260","customfield_18462",
+    "customfield_20960","customfield_22362","customfield_19967",
+    "customfield_29664","customfield_25070","customfield_26661",
+    "customfield_26660","customfield_28760","customfield_26665",
+    "customfield_11320","customfield_11266","customfield_23863",
+    "customfield_23870","customfield_10591","customfield_23866",
+    "customfield_23867","aggregatetimespent",
+    "customfield_12963","customfield_12964","customfield_11760",
+    "customfield_14073","customfield_11220","customfield_28262",
+    "customfield_10697","customfield_15161"
+]
+
+# ==========================
+# CSV COLUMNS (OUTPUT ORDER)
+# ==========================
+# (column, JIRA field, kind) - kind picks the extractor used for the value
+FIELD_SPECS = [
+    ("Project", "project", "project"),
+    ("Key", "key", "key"),
+    ("Summary", "summary", "raw"),
+    ("Issue Type", "issuetype", "value"),
+    ("Priority", "priority", "value"),
+    ("Task Type", "customfield_10190", "value"),
+    ("Task Sub-Type", "customfield_23875", "value"),
+    ("Status", "status", "value"),
+    ("Assignee", "assignee", "value"),
+    ("Reporter", "reporter", "value"),
+    ("Resources", "customfield_10748", "value"),
+
+    # Datetime fields (IST)
+    ("Created", "created", "datetime"),
+    ("Updated", "updated", "datetime"),
+    ("Resolved", "resolutiondate", "datetime"),
+    ("Expected Closure By", "customfield_10072", "datetime"),
+    ("Resolution Completion Date", "customfield_10076", "datetime"),
+    ("Actual Closure Date", "customfield_10090", "datetime"),
+    ("Staging Completion Date/Time", "customfield_18463", "datetime"),
+    ("Production Completion Date/Time", "customfield_18464", "datetime"),
+    ("Start Work Date", "customfield_14073", "datetime"),
+    ("Accepted Date/Time", "customfield_11220", "datetime"),
+    ("Expected Closure By (Reporting)", "customfield_28262", "datetime"),
+    ("Approved Date", "customfield_10697", "datetime"),
+    ("Closure Date/Time", "customfield_15161", "datetime"),
+
+    # Date-only fields
+    ("Planned Start Date", "customfield_12963", "date"),
+    ("Planned End Date", "customfield_12964", "date"),
+    ("Planned Release Date", "customfield_11760", "date"),
+
+    # Option / String fields
+    ("Deployment Location", "customfield_28467", "value"),
+    ("Request Type", "customfield_10007", "value"),
+    ("Complexity", "customfield_14960", "value"),
+    ("Product Variant", "customfield_10078", "value"),
+    ("Customers", "customfield_10001", "value"),
+    ("Justification / Revenue Expectation", "customfield_10120", "raw"),
+    ("Circle", "customfield_11342", "raw"),
+    ("Geography", "customfield_11563", "value"),
+    ("Accepted By", "customfield_26667", "value"),
+    ("Staging Setup Available", "customfield_18161", "value"),
+    ("Downtime Taken", "customfield_18172", "value"),
+    ("Change Type", "customfield_11332", "value"),
+    ("Services", "customfield_25561", "value"),
+    ("Change Process Owner", "customfield_18460", "value"),
+    ("Production UAT Required", "customfield_18461", "value"),
+    ("Request Include In Planner", "customfield_18162", "value"),
+    ("Change Sub Type", "customfield_22260", "value"),
+    ("Staging UAT Required", "customfield_18462", "value"),
+    ("QAed Release", "customfield_20960", "value"),
+    ("Feasibility Testing", "customfield_22362", "value"),
+    ("Expectation Met?", "customfield_19967", "value"),
+    ("Is Security Patch", "customfield_29664", "value"),
+    ("Type of CR", "customfield_25070", "value"),
+    ("Change Category", "customfield_26661", "value"),
+    ("Emergency", "customfield_26660", "value"),
+    ("CR Raised By", "customfield_28760", "value"),
+    ("Is CPO approval needed?", "customfield_26665", "value"),
+    ("Related to Customer Service Team", "customfield_11320", "value"),
+    ("Country", "customfield_11266", "value"),
+    ("Incident Type", "customfield_23863", "value"),
+    ("Incident Sub Type", "customfield_23870", "value"),
+    ("Location Name", "customfield_10591", "raw"),
+    ("Brief Description", "customfield_23866", "raw"),
+    ("L3 Team Analysis/Findings", "customfield_23867", "raw"),
+
+    # Time tracking
+    ("Σ Time Spent (Seconds)", "aggregatetimespent", "raw"),
+    ("Σ Time Spent (Hours)", "aggregatetimespent", "hours")
+]
+
+CONFIG = ReportConfig(
+    description="JIRA INFOSOL Report",
+    jql_filter='project = "Infrastructure Solutions"',
+    fields=FIELDS,
+    field_specs=FIELD_SPECS,
+    page_size=500
+)
+
+if __name__ == "__main__":
+    run_report(CONFIG)
@@ -0,0 +1,83 @@
+from app.jira_report import ReportConfig, run_report
+
+# ==========================
+# FIELDS (UNCHANGED – 40)
+# ==========================
+FIELDS = [
+    "project","issuekey","summary","issuetype","priority","status",
+    "assignee","reporter","created","updated","resolutiondate",
+    "customfield_10701","customfield_10300","customfield_10801",
+    "customfield_10301","customfield_10123","customfield_10112",
+    "customfield_10124","customfield_10126","customfield_10127",
+    "customfield_10130","customfield_10131","customfield_10125",
+    "customfield_10132","customfield_10133","customfield_10134",
+    "customfield_11403","customfield_11402","customfield_11404",
+    "customfield_11406","customfield_10143","customfield_10146",
+    "customfield_10148","customfield_11500","customfield_10136",
+    "customfield_10504","customfield_11001","customfield_10806",
+    "customfield_11401","aggregatetimespent"
+]
+
+# ==========================
+# CSV COLUMNS (OUTPUT ORDER)
+# ==========================
+# (column, JIRA field, kind) - kind picks the extractor used for the value
+FIELD_SPECS = [
+    ("Project", "project", "project"),
+    ("Key", "key", "key"),
+    ("Summary", "summary", "raw"),
+    ("Issue Type", "issuetype", "value"),
+    ("Priority", "priority", "value"),
+    ("Status", "status", "value"),
+    ("Assignee", "assignee", "value"),
+    ("Reporter", "reporter", "value"),
+
+    ("Created", "created", "datetime"),
+    ("Updated", "updated", "datetime"),
+    ("Resolved", "resolutiondate", "datetime"),
+    ("Assigned Date Bot", "customfield_10701", "datetime"),
+    ("Escalation Date L2", "customfield_10300", "datetime"),
+    ("Assigned Date L2", "customfield_10801", "datetime"),
+    ("Escalation Date L3", "customfield_10301", "datetime"),
+    ("Expected Resolution Date/Time", "customfield_11401", "datetime"),
+
+    ("Summary Details", "customfield_10123", "raw"),
+    ("Source", "customfield_10112", "value"),
+    ("Application", "customfield_10124", "value"),
+    ("Geography", "customfield_10126", "value"),
+    ("Country", "customfield_10127", "value"),
+    ("Unit", "customfield_10130", "value"),
+    ("Site_Location", "customfield_10131", "raw"),
+    ("Affected_CI", "customfield_10125", "raw"),
+    ("Infra_App", "customfield_10132", "value"),
+    ("Issue_Category", "customfield_10133", "value"),
+    ("Owner_Name", "customfield_10134", "raw"),
+    ("Response SLA", "customfield_11403", "value"),
+    ("Resolution SLA", "customfield_11402", "value"),
+    ("Reason for Missed Resolution SLA", "customfield_11404", "value"),
+    ("Services", "customfield_11406", "value"),
+    ("Fault Attribution", "customfield_10143", "value"),
+    ("Closure Code", "customfield_10146", "value"),
+    ("Resolved By (Team)", "customfield_10148", "value"),
+    ("Service Impact", "customfield_11500", "value"),
+    ("Hysteresis_State", "customfield_10136", "raw"),
+    ("Hysteresis_Counter", "customfield_10504", "raw"),
+    ("Call Summary", "customfield_11001", "raw"),
+    ("Assigned Back L2 (Yes/No)", "customfield_10806", "value"),
+
+    ("Σ Time Spent (Seconds)", "aggregatetimespent", "raw")
+]
+
+CONFIG = ReportConfig(
+    description="JSM Incident Report",
+    # Spans projects, so rows come out grouped by project key (see build_jql)
+    jql_filter="issuetype = Incident",
+    fields=FIELDS,
+    field_specs=FIELD_SPECS,
+    page_size=1000,
+    timeout=60,
+    auth="jsm_pat"
+)
+
+if __name__ == "__main__":
+    run_report(CONFIG)
@@ -0,0 +1,98 @@
+from app.jira_report import ReportConfig, run_report
+
+# ==========================
+# FIELDS (UNCHANGED – 52)
+# ==========================
+FIELDS = [
+    "project","issuekey","summary","issuetype","priority","status",
+    "assignee","reporter","customfield_10748","customfield_26667",
+    "customfield_30060","created","updated","resolutiondate",
+    "customfield_10072","customfield_12963","customfield_12964",
+    "customfield_18176","customfield_18170","customfield_10090",
+    "customfield_18464","customfield_14073","customfield_11220",
+    "customfield_28262","customfield_10001","customfield_10007",
+    "customfield_10078","customfield_18161","customfield_18172",
+    "customfield_11332","customfield_18460","customfield_18461",
+    "customfield_18162","customfield_22260","customfield_18462",
+    "customfield_20960","customfield_19967","customfield_23260",
+    "customfield_25070","customfield_26661","customfield_26660",
+    "customfield_27571","customfield_28260","customfield_11320",
+    "customfield_25561","customfield_29663","customfield_29664",
+    "customfield_30062","customfield_30063","customfield_30061",
+    "customfield_22362","aggregatetimespent"
+]
+
+# ==========================
+# CSV COLUMNS (OUTPUT ORDER)
+# ==========================
+# (column, JIRA field, kind) - kind picks the extractor used for the value
+FIELD_SPECS = [
+    ("Project", "project", "project"),
+    ("Key", "key", "key"),
+    ("Summary", "summary", "raw"),
+    ("Issue Type", "issuetype", "value"),
+    ("Priority", "priority", "value"),
+    ("Status", "status", "value"),
+    ("Assignee", "assignee", "value"),
+    ("Reporter", "reporter", "value"),
+    ("Resources", "customfield_10748", "value"),
+    ("Accepted By", "customfield_26667", "value"),
+    ("MOP Reviewer", "customfield_30060", "value"),
+
+    ("Created", "created", "datetime"),
+    ("Updated", "updated", "datetime"),
+    ("Resolved", "resolutiondate", "datetime"),
+    ("Expected Closure By", "customfield_10072", "datetime"),
+    ("Production UAT Start", "customfield_18176", "datetime"),
+    ("Production UAT Closed", "customfield_18170", "datetime"),
+    ("Actual Closure Date", "customfield_10090", "datetime"),
+    ("Production Completion Date", "customfield_18464", "datetime"),
+    ("Start Work Date", "customfield_14073", "datetime"),
+    ("Accepted Date/Time", "customfield_11220", "datetime"),
+    ("Expected Closure Reporting", "customfield_28262", "datetime"),
+
+    ("Planned Start Date", "customfield_12963", "date"),
+    ("Planned End Date", "customfield_12964", "date"),
+
+    ("Customers", "customfield_10001", "value"),
+    ("Request Type", "customfield_10007", "value"),
+    ("Product Variant", "customfield_10078", "value"),
+    ("Staging Setup Available", "customfield_18161", "value"),
+    ("Downtime Taken", "customfield_18172", "value"),
+    ("Change Type", "customfield_11332", "value"),
+    ("Change Process Owner", "customfield_18460", "value"),
+    ("Production UAT Required", "customfield_18461", "value"),
+    ("Request Include In Planner", "customfield_18162", "value"),
+    ("Change Sub Type", "customfield_22260", "value"),
+    ("Staging UAT Required", "customfield_18462", "value"),
+    ("QAed Release", "customfield_20960", "value"),
+    ("Expectation Met?", "customfield_19967", "value"),
+    ("Raised By", "customfield_23260", "value"),
+    ("Type of CR", "customfield_25070", "value"),
+    ("Change Category", "customfield_26661", "value"),
+    ("Emergency", "customfield_26660", "value"),
+    ("Type Of Request", "customfield_27571", "value"),
+    ("Required Reporting Validation", "customfield_28260", "value"),
+    ("Related to Customer Service Team", "customfield_11320", "value"),
+    ("Services", "customfield_25561", "value"),
+    ("Change Classification", "customfield_29663", "value"),
+    ("Is Security Patch", "customfield_29664", "value"),
+    ("Change Execution Mode", "customfield_30062", "value"),
+    ("OARM_JOB_ID", "customfield_30063", "raw"),
+    ("MOP Documents Attached", "customfield_30061", "value"),
+    ("Feasibility Testing", "customfield_22362", "value"),
+
+    ("Σ Time Spent (Seconds)", "aggregatetimespent", "raw")
+]
+
+CONFIG = ReportConfig(
+    description="JIRA OPS CR Report",
+    jql_filter='project = Operations AND issuetype = "DevOpsL3Prod - ChangeRequest"',
+    fields=FIELDS,
+    field_specs=FIELD_SPECS,
+    page_size=1000,
+    timeout=60
+)
+
+if __name__ == "__main__":
+    run_report(CONFIG)
@@ -0,0 +1,73 @@
+from app.jira_report import ReportConfig, run_report
+
+# ==========================
+# FIELDS (UNCHANGED – 34)
+# ==========================
+FIELDS = [
+    "project","issuekey","summary","issuetype","priority","status",
+    "assignee","reporter","customfield_10748","created","updated",
+    "resolutiondate","customfield_10072","customfield_10076",
+    "customfield_10190","customfield_23875","customfield_10007",
+    "customfield_10078","customfield_10001","customfield_11342",
+    "customfield_25561","aggregatetimespent","customfield_22360",
+    "customfield_11240","customfield_10090","customfield_22162",
+    "customfield_21460","customfield_10077","customfield_15060",
+    "customfield_22361","customfield_21161","customfield_21160",
+    "customfield_23979"
+]
+
+# ==========================
+# CSV COLUMNS (OUTPUT ORDER)
+# ==========================
+# (column, JIRA field, kind) - kind picks the extractor used for the value
+FIELD_SPECS = [
+    ("Project", "project", "project"),
+    ("Key", "key", "key"),
+    ("Summary", "summary", "raw"),
+    ("Issue Type", "issuetype", "value"),
+    ("Priority", "priority", "value"),
+    ("Status", "status", "value"),
+    ("Assignee", "assignee", "value"),
+    ("Reporter", "reporter", "value"),
+    ("Resources", "customfield_10748", "value"),
+
+    ("Created", "created", "datetime"),
+    ("Updated", "updated", "datetime"),
+    ("Resolved", "resolutiondate", "datetime"),
+    ("Expected Closure By", "customfield_10072", "datetime"),
+    ("Resolution Completion Date", "customfield_10076", "datetime"),
+    ("Actual Closure Date", "customfield_10090", "datetime"),
+    ("Initial Start Date", "customfield_22360", "datetime"),
+    ("Start Date", "customfield_11240", "datetime"),
+    ("Issue Reported Date Time", "customfield_22162", "datetime"),
+
+    ("Task Type", "customfield_10190", "value"),
+    ("Task Sub-Type", "customfield_23875", "value"),
+    ("Request Type", "customfield_10007", "value"),
+    ("Product Variant", "customfield_10078", "value"),
+    ("Customers", "customfield_10001", "value"),
+    ("Circle", "customfield_11342", "raw"),
+    ("Services", "customfield_25561", "value"),
+    ("Type of Bug", "customfield_21460", "value"),
+    ("Reason for Bug", "customfield_15060", "value"),
+    ("Resolved By", "customfield_22361", "value"),
+    ("Fault Attribution", "customfield_23979", "value"),
+
+    ("Resolution / Completion Details", "customfield_10077", "raw"),
+    ("Response SLA (Bug)", "customfield_21161", "raw"),
+    ("Resolution SLA (Bug)", "customfield_21160", "raw"),
+
+    ("Σ Time Spent (Seconds)", "aggregatetimespent", "raw")
+]
+
+CONFIG = ReportConfig(
+    description="JIRA OPS Task & Bug Report",
+    jql_filter="project = Operations AND issuetype in (Bug, Task)",
+    fields=FIELDS,
+    field_specs=FIELD_SPECS,
+    page_size=1000,
+    timeout=60
+)
+
+if __name__ == "__main__":
+    run_report(CONFIG)
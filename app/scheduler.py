@@ -1,24 +1,149 @@
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
+from apscheduler.executors.pool import ThreadPoolExecutor, ProcessPoolExecutor
 from app.db import init_db, get_conn
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime, timedelta
 from app.email_utils import send_email_with_attachment
-import subprocess
+from app.jira_report import run_report
+from importlib import import_module
+from functools import lru_cache
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import concurrent.futures
+import logging
+import multiprocessing
+import queue
+import signal
+import sys
+import threading
+import time
 import uuid
 import os
 
-scheduler = BackgroundScheduler(timezone="Asia/Kolkata")
-
-REPORT_DISPLAY_NAMES = {
-        "jira_infosol": "Infosol",
-        "jira_ops": "OPS-Task-Bug",
-        "jira_ops_cr": "OPS-CR",
-        "jira_asd_incident": "ASD-Incident",
-        "jira_asd_pm": "ASD-PM",
-        "jsm_incident": "JSM-Incident",
+# Reports run on the process pool so overlapping schedules get their own
+# cores (and GIL); pool workers are reused, so imports are paid once each.
+# coalesce folds runs missed during downtime into one instead of a burst,
+# and a schedule never overlaps itself if a run outlasts its interval.
+
+# Pool workers post ("start" | "done", pid) around each report run, so
+# stop_scheduler() knows which workers are mid-report without reaching
+# into the pool. Replaced in each worker by the parent's queue.
+RUN_EVENTS = multiprocessing.get_context("spawn").Queue()
+
+def init_report_worker(run_events):
+    global RUN_EVENTS
+    RUN_EVENTS = run_events
+
+    # A pool worker killed at shutdown never runs its atexit hooks, so
+    # records still queued for the listener (the last lines of a run,
+    # email errors) would be dropped; workers write straight to the stream
+    atexit.unregister(_log_listener.stop)
+    _log_listener.stop()
+    log.handlers[:] = [_log_handler]
+
+    # Outside a run, SIGTERM is ignored: a worker may still be sending a
+    # finished report from EMAIL_POOL, which it drains before exiting on
+    # the pool's shutdown sentinel. run_report installs its own handler
+    # for the duration of a run and restores this one afterwards.
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+REPORT_POOL = ProcessPoolExecutor(
+    max_workers=os.cpu_count(),
+    pool_kwargs={"initializer": init_report_worker, "initargs": (RUN_EVENTS,)}
+)
+
+scheduler = BackgroundScheduler(
+    executors={
+        "default": ThreadPoolExecutor(20),
+        "processpool": REPORT_POOL
+    },
+    job_defaults={
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": 3600
+    },
+    timezone="Asia/Kolkata"
+)
+
+# Records are queued and written by a listener thread, so scheduler and
+# email threads never block on stdout while a job is running (report pool
+# workers log directly, see init_report_worker)
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+log = logging.getLogger("scheduler")
+log.setLevel(logging.INFO)
+log.addHandler(QueueHandler(_log_queue))
+log.propagate = False
+
+# schedule_id -> report_schedules row its scheduled job was built from
+LOADED_SCHEDULES = {}
+
+# FastAPI runs sync endpoints on a threadpool, so two reloads can overlap;
+# one at a time keeps LOADED_SCHEDULES and the scheduler in step
+LOAD_LOCK = threading.Lock()
+
+@dataclass(frozen=True)
+class ReportSpec:
+    display_name: str   # used in the email subject and attachment name
+    module: str         # report module run via run_report
+
+
+# 🔑 MUST match Generate Report dropdown values
+REPORT_SPECS = {
+        "jira_infosol": ReportSpec("Infosol", "app.reports.infosol"),
+        "jira_ops": ReportSpec("OPS-Task-Bug", "app.reports.ops_task_bug"),
+        "jira_ops_cr": ReportSpec("OPS-CR", "app.reports.ops_cr"),
+        "jira_asd_incident": ReportSpec("ASD-Incident", "app.reports.asd_incident"),
+        "jira_asd_pm": ReportSpec("ASD-PM", "app.reports.asd_pm"),
+        "jsm_incident": ReportSpec("JSM-Incident", "app.reports.jsm_incident"),
     }
 
+EMAIL_BODY = (
+    "Hello,\n\n"
+    "Please find the attached Jira report.\n\n"
+    "Report: {report_name}\n"
+    "Date range: {start_date} to {end_date}\n\n"
+    "Regards,\nDevOps NOC - Jira Report Scheduler"
+)
+
+EMAIL_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="email")
+
+def remove_job_files(job_id):
+    # Scheduled output is only ever delivered by email, so nothing
+    # reads it afterwards; don't leave it in /tmp for the 24h sweep
+    for path in (f"/tmp/{job_id}.csv", f"/tmp/{job_id}.json"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def email_report(job_id, email_to, report_name, start_date, end_date, attachment_filename):
+    try:
+        send_email_with_attachment(
+            to_email=email_to,
+            subject=f"Scheduled Jira Report: {report_name}",
+            body=EMAIL_BODY.format(
+                report_name=report_name,
+                start_date=start_date,
+                end_date=end_date
+            ),
+            attachment_path=f"/tmp/{job_id}.csv",
+            attachment_filename=attachment_filename
+        )
+        log.info(f"[EMAIL] Sent report to {email_to}")
+    except Exception as e:
+        log.error(f"[EMAIL][ERROR] Failed to send email: {e}")
+    finally:
+        remove_job_files(job_id)
+
 def run_scheduled_job(
     schedule_id,
     report_type,
@@ -32,7 +157,7 @@ def run_scheduled_job(
     job_id = str(uuid.uuid4())
     output_file = f"/tmp/{job_id}.csv"
 
-    print(
+    log.info(
         f"[SCHEDULER] Running schedule_id={schedule_id} "
         f"job_id={job_id} "
         f"at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} IST"
@@ -59,28 +184,17 @@ def run_scheduled_job(
         # till_now respected as provided
         pass
 
-    report_name = REPORT_DISPLAY_NAMES.get(report_type, report_type)
-    safe_report_name = report_name.replace(" ", "_")
-    attachment_filename = f"{safe_report_name}_{start_date}_to_{end_date}.csv"
-
-    # 🔑 MUST match Generate Report dropdown values
-    script_map = {
-        "jira_infosol": "app/Infosol.py",
-        "jira_ops": "app/OPS-Task-Bug.py",
-        "jira_ops_cr": "app/OPS-CR.py",
-        "jira_asd_incident": "app/ASD-Incident.py",
-        "jira_asd_pm": "app/ASD-PM.py",
-        "jsm_incident": "app/JSM-Incident.py",
-    }
-
-    script = script_map.get(report_type)
-    if not script:
+    spec = REPORT_SPECS.get(report_type)
+    if not spec:
         # Fail loudly – this should never be silent
         raise ValueError(f"[SCHEDULER] Unknown report_type: {report_type}")
 
-    cmd = [
-        "python",
-        script,
+    module = spec.module
+    report_name = spec.display_name
+    safe_report_name = report_name.replace(" ", "_")
+    attachment_filename = f"{safe_report_name}_{start_date}_to_{end_date}.csv"
+
+    argv = [
         "--start-date", start_date,
         "--end-date", end_date,
         "--job-id", job_id,
@@ -88,50 +202,63 @@ def run_scheduled_job(
     ]
 
     if statuses:
-        cmd.extend(["--statuses", statuses])
+        argv.extend(["--statuses", statuses])
 
     if till_now:
-        cmd.append("--till-now")
-
-    print("[SCHEDULER] Executing command:")
-    print(" ".join(cmd))
-
-    subprocess.run(cmd, check=True)
+        argv.append("--till-now")
+
+    # Runs in this process: the report module is imported once and reused,
+    # instead of paying for a fresh interpreter and imports on every run
+    log.info("[SCHEDULER] Running report:")
+    log.info(f"{module} {' '.join(argv)}")
+
+    RUN_EVENTS.put(("start", os.getpid()))
+    try:
+        run_report(import_module(module).CONFIG, argv)
+    except BaseException:
+        # The progress file is kept: it records the run as failed or
+        # cancelled, and the 24h sweep removes it later
+        try:
+            os.remove(output_file)
+        except FileNotFoundError:
+            pass
+        raise
+    finally:
+        RUN_EVENTS.put(("done", os.getpid()))
 
     if email_to:
-        try:
-            send_email_with_attachment(
-                to_email=email_to,
-                subject=f"Scheduled Jira Report: {report_name}",
-                body=(
-                    f"Hello,\n\n"
-                    f"Please find the attached Jira report.\n\n"
-                    f"Report: {report_name}\n"
-                    f"Date range: {start_date} to {end_date}\n\n"
-                    f"Regards,\nDevOps NOC - Jira Report Scheduler"
-                ),
-                attachment_path=output_file,
-                attachment_filename=attachment_filename
-            )
-            print(f"[EMAIL] Sent report to {email_to}")
-        except Exception as e:
-            print(f"[EMAIL][ERROR] Failed to send email: {e}")
-
-    print(
+        # SMTP handshake and upload happen on the email pool, so this
+        # worker is free for the next report as soon as the file exists
+        EMAIL_POOL.submit(
+            email_report,
+            job_id,
+            email_to,
+            report_name,
+            start_date,
+            end_date,
+            attachment_filename
+        )
+    else:
+        remove_job_files(job_id)
+
+    log.info(
         f"[SCHEDULER] Completed schedule_id={schedule_id} "
-        f"job_id={job_id} output={output_file}"
+        f"job_id={job_id}"
     )
 
+# Triggers are immutable once built, so schedules with the same timing can
+# share one instead of re-parsing the cron fields on every reload
+@lru_cache(maxsize=4096)
 def create_trigger(schedule_type, schedule_value, run_time):
-    hour, minute = map(int, run_time.split(":"))
-
     if schedule_type == "once":
-        run_dt = datetime.strptime(
-            f"{schedule_value} {run_time}",
-            "%Y-%m-%d %H:%M"
-        )
+        # "YYYY-MM-DD HH:MM" is ISO format; fromisoformat parses it in C
+        # without pulling in the locale-aware _strptime machinery
+        run_dt = datetime.fromisoformat(f"{schedule_value} {run_time}")
         return DateTrigger(run_date=run_dt)
 
+    # Cron schedules only need the time of day
+    hour, minute = map(int, run_time.split(":"))
+
     if schedule_type == "daily":
         return CronTrigger(hour=hour, minute=minute)
 
@@ -153,23 +280,27 @@ def create_trigger(schedule_type, schedule_value, run_time):
 
     raise ValueError(f"Unknown schedule_type: {schedule_type}")
 
-def load_schedules():
-    # 🔥 IMPORTANT: clear existing jobs first
-    scheduler.remove_all_jobs()
-
-    init_db()
+def sync_jobs(rows):
+    # Reconcile instead of removing and re-adding every job: only schedules
+    # that are new, edited, or no longer in the scheduler get a new trigger
+    enabled_ids = {row[0] for row in rows}
 
-    with get_conn() as conn:
-        rows = conn.execute("""
-            SELECT id, report_type, statuses,
-                start_date, end_date, till_now,
-                schedule_type, schedule_value, run_time,
-                range_days, email_to
-            FROM report_schedules
-            WHERE enabled = 1
-        """).fetchall()
+    for schedule_id in list(LOADED_SCHEDULES):
+        if schedule_id not in enabled_ids:
+            LOADED_SCHEDULES.pop(schedule_id, None)
+            if scheduler.get_job(schedule_id):
+                scheduler.remove_job(schedule_id)
+            log.info(f"[SCHEDULER] Removed schedule {schedule_id}")
 
     for row in rows:
+        if LOADED_SCHEDULES.get(row[0]) == row and scheduler.get_job(row[0]):
+            continue
+
+        if row[1] not in REPORT_SPECS:
+            # Would only fail when it fires; don't give it a scheduler slot
+            log.error(f"[SCHEDULER] Skipping schedule {row[0]}: unknown report_type {row[1]}")
+            continue
+
         (
             schedule_id, report_type, statuses,
             start_date, end_date, till_now,
@@ -183,9 +314,22 @@ def load_schedules():
             run_time
         )
 
+        if (
+            schedule_type == "once"
+            and schedule_id in LOADED_SCHEDULES
+            and trigger.run_date <= datetime.now(trigger.run_date.tzinfo)
+        ):
+            # Loaded before and now past: APScheduler dropped the date job
+            # after it fired, and re-adding it within misfire_grace_time
+            # would send the one-off report again. A past one-off that was
+            # never loaded (missed during downtime) is still added, and
+            # misfire_grace_time decides whether it runs
+            continue
+
         scheduler.add_job(
             run_scheduled_job,
             trigger=trigger,
+            executor="processpool",
             id=schedule_id,
             args=[
                 schedule_id, report_type, statuses,
@@ -194,24 +338,48 @@ def load_schedules():
             ],
             replace_existing=True
         )
+        LOADED_SCHEDULES[schedule_id] = row
 
-        print(
+        log.info(
             f"[SCHEDULER] Loaded {schedule_type} schedule "
             f"{schedule_id} at {run_time} IST"
         )
 
+def load_schedules():
+    with LOAD_LOCK:
+        # Schema is set up once by start_scheduler(); reloads only read
+        with get_conn() as conn:
+            rows = conn.execute("""
+                SELECT id, report_type, statuses,
+                    start_date, end_date, till_now,
+                    schedule_type, schedule_value, run_time,
+                    range_days, email_to
+                FROM report_schedules
+                WHERE enabled = 1
+            """).fetchall()
+
+        # While paused, add_job/remove_job don't wake the scheduler thread one
+        # by one; resume() works out the next wakeup once for the whole batch
+        paused = scheduler.state == STATE_RUNNING
+        if paused:
+            scheduler.pause()
+
+        try:
+            sync_jobs(rows)
+        finally:
+            if paused:
+                scheduler.resume()
+
 def run_test_job():
     job_id = str(uuid.uuid4())
     output_file = f"/tmp/{job_id}.csv"
 
-    print(
+    log.info(
         f"[SCHEDULER] Running test job job_id={job_id} "
         f"at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} IST"
     )
 
-    cmd = [
-        "python",
-        "app/ASD-Incident.py",
+    argv = [
         "--start-date", "2026-02-01",
         "--end-date", "2026-02-05",
         "--statuses", "Resolved",
@@ -219,14 +387,58 @@ def run_test_job():
         "--output", output_file,
     ]
 
-    print("[SCHEDULER] Executing command:")
-    print(" ".join(cmd))
+    log.info("[SCHEDULER] Running report:")
+    log.info(f"app.reports.asd_incident {' '.join(argv)}")
 
-    subprocess.run(cmd, check=True)
+    run_report(import_module("app.reports.asd_incident").CONFIG, argv)
 
-    print(f"[SCHEDULER] Job {job_id} completed. Output: {output_file}")
+    log.info(f"[SCHEDULER] Job {job_id} completed. Output: {output_file}")
 
 def start_scheduler():
     scheduler.start()
     init_db()
     load_schedules()
+
+def stop_scheduler(deadline):
+    # scheduler.shutdown() leaves reports already running in the pool to
+    # finish on their own. SIGTERM makes run_report record "cancelled" and
+    # return; the worker then drains EMAIL_POOL and exits on the pool's
+    # shutdown sentinel. Workers not in a run are never signalled.
+    running = set()
+
+    def signal_worker(pid, signum):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            running.discard(pid)
+
+    def track(kind, pid):
+        if kind == "start":
+            running.add(pid)
+        else:
+            running.discard(pid)
+
+    while True:
+        try:
+            track(*RUN_EVENTS.get_nowait())
+        except queue.Empty:
+            break
+
+    scheduler.shutdown(wait=False)
+
+    for pid in list(running):
+        signal_worker(pid, signal.SIGTERM)
+
+    while running:
+        try:
+            kind, pid = RUN_EVENTS.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            break
+        track(kind, pid)
+        if kind == "start":
+            # Run was already queued in the pool when the scheduler stopped
+            signal_worker(pid, signal.SIGTERM)
+
+    for pid in list(running):
+        log.warning(f"[SCHEDULER] Report worker {pid} did not stop in time, killing it")
+        signal_worker(pid, signal.SIGKILL)